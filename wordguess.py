@@ -8,9 +8,10 @@ from unidecode import unidecode
 import argparse
 import curses
 import math
+import mmap
 import os
 import random
-import time
+import re
 
 # ============================================================================
 
@@ -69,6 +70,35 @@ class WordGuess():
         "IVETVA", "JNAX",
     )
 
+    # The translation table for rot13'ing uppercase words
+    _ROT13 = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ',
+                           'NOPQRSTUVWXYZABCDEFGHIJKLM')
+
+    # The offensive words, decoded once up front so that we can check the
+    # dictionary words against them directly
+    _OFFENSIVE_SET = frozenset(
+        ' '.join(_OFFENSIVE_WORDS).translate(_ROT13).split()
+    )
+
+    # Suffixes which suggest that a word is a plural, past tense, etc., along
+    # with the endings which we put back onto the stem to get the word which it
+    # was derived from. These are longest first.
+    _SUFFIX_STEMS = {
+        'IES' : ('Y',),
+        'IED' : ('Y',),
+        'IER' : ('Y',),
+        'ING' : ('Y', '', 'E'),
+        'ED'  : ('',),
+        'ER'  : ('',),
+        'ES'  : ('',),
+        'LY'  : ('',),
+        'D'   : ('',),
+        'R'   : ('',),
+        'S'   : ('',),
+        'Y'   : ('',),
+    }
+    _SUFFIXES = tuple(_SUFFIX_STEMS)
+
     # ------------------------------------------------------------------------
 
     def __init__(self,
@@ -93,70 +123,90 @@ class WordGuess():
         self._max_x = None
         self._max_y = None
 
+        # The windows for the different parts of the screen. Each of these is
+        # refreshed independently, so that changing one doesn't mean sending
+        # the others to the terminal again.
+        self._board_win = None
+        self._info_wins = ()
+        self._score_win = None
+        self._msg_win   = None
+        self._windows   = ()
+
+        # The display attributes, by colour pair
+        self._attrs = dict()
+
+        # The letter for each key code, where it is one of self._letters
+        self._key_letters = []
+
+        # An empty row of the board, including its edges
+        self._blank_row = None
+
+        # Where each info letter is drawn, as (window,x,y)
+        self._info_coords = dict()
+
+        # What is currently on the board, as (x,y) -> (character, pair), and
+        # the colour pairs of the info letters. We remember these so that we
+        # can redraw them if the window changes size.
+        self._board_cells = dict()
+        self._info_pairs  = dict()
+
+        # The current score and message
+        self._score = ''
+        self._msg   = ''
+
+        # Whether we have drawn anything since the screen was last refreshed
+        self._dirty = False
+
         # The set of letters which we know about. We ignore letters which are
         # not in this set since they can be sent as control chars by the
         # terminal and misinterpreted.
         self._letters = set()
 
-        # Read in the dictionary of words
-        self._words = []
-        self._all_words = set()
+        # Read in the dictionary of words. We do this in bulk, rather than line
+        # by line, so that the per-character work happens in C. We decode
+        # straight out of a memory map of the file, if we can, which saves
+        # reading it all into memory only to copy it again.
         print(f"  Loading dictionary from {words_file}")
         with open(words_file, 'rb') as fh:
-            for line in fh.readlines():
-                # Read
-                try:
-                    word = line.decode()
-                except UnicodeDecodeError:
-                    pass
-
-                # If we are not accepting accented words then turn them into
-                # ASCII
-                if not accented and not all('A' <= c <= 'Z' for c in word):
-                    word = unidecode(word)
-                    
-                # Tidy to be like we like it
-                word = word.strip()
-                WORD = word.upper()
-
-                # Remember this in self._all_words since we need to care about them
-                # for checking plurals etc.
-                self._all_words.add(WORD)
-
-                # Print out progress. Printing is _slow_ so not too much.
-                count = len(self._all_words)
-                if count & 0x3ff == 0:
-                    print(f"  Loaded {count} words\r", end='', flush=True)
-
-                # Ignore proper names and abbreviations, these will start with a
-                # capital letter
-                if len(word) > 0 and 'A' <= word[0] <= 'Z':
-                    continue
+            try:
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    raw = str(mm, 'utf-8', 'replace')
+            except (ValueError, OSError):
+                # Empty files, pipes, etc. can't be mapped
+                raw = fh.read().decode('utf-8', 'replace')
+
+        # If we are not accepting accented words then turn them into ASCII
+        if not accented and not raw.isascii():
+            raw = unidecode(raw)
+
+        # Remember all the words, uppercased, in self._all_words since we need
+        # to care about them for checking plurals etc.
+        self._all_words = set(raw.upper().split())
+        print(f"  Loaded {len(self._all_words)} words")
+
+        # Now that we know all the words, pick out the ones which we want to
+        # play with. We first find the candidates using a regular expression
+        # over the whole dictionary, so that most of the words are rejected in
+        # C. Candidates are lines which are all letters and of the right
+        # length. Proper names and abbreviations will start with a capital
+        # letter so we ignore those too. Upper-casing can lengthen a word
+        # which isn't plain ASCII, e.g. "maße" becomes "MASSE", so for those we
+        # only bound the length here and let _is_wanted() check it exactly.
+        count = f'{length - 1}' if raw.isascii() else f'0,{length - 1}'
+        candidates = re.findall(
+            rf'(?m)^\s*([^\W\d_A-Z][^\W\d_]{{{count}}})\s*$', raw
+        )
 
-                # Now we want it all uppercase
-                word = WORD
-
-                # Check that it's what we want. We avoid offensive words and
-                # ones which look like they are plurals, past tense, etc. Some
-                # of this will general false positives but that's not the end of
-                # the world.
-                if (self._rot13upper(word) not in self._OFFENSIVE_WORDS and
-                    word.isalpha()                                      and
-                    len(word) == length                                 and
-                    not (word[-1:] in [ 'D',  'R',  'S', 'Y'] and
-                         word[:-1] in self._all_words)                  and
-                    not (word[-2:] in ['ED', 'ER', 'ES', 'LY'] and
-                         word[:-2] in self._all_words)                  and
-                    not (word[-3:] in [ 'IES',  'IED', 'IER', 'ING'] and
-                         (word[:-3] + 'Y') in self._all_words)          and
-                    not (word[-3:] == 'ING' and
-                         ((word[:-3])       in self._all_words or
-                          (word[:-3] + 'E') in self._all_words))):
-                    # This is a word which we want so we remember it
-                    self._words.append(word)
-
-                    # And save all its letters in the set of known ones
-                    self._letters.update(word)
+        # We don't change the words after this so we keep them in a tuple,
+        # which has no spare capacity to waste memory on
+        self._words = tuple({
+            word
+            for word in map(str.upper, candidates)
+            if self._is_wanted(word, length)
+        })
+
+        # And save all their letters in the set of known ones
+        self._letters.update(''.join(self._words))
 
         print("  Loading done!")
 
@@ -188,6 +238,22 @@ class WordGuess():
         # Display dimensions
         (self._max_y, self._max_x) = self._scr.getmaxyx()
 
+        # Where everything goes
+        self._layout()
+
+        # The letter which each key gives us, if any. Anything not in here is
+        # ignored.
+        self._key_letters = [None] * 256
+        for letter in self._letters:
+            for char in (letter, letter.lower()):
+                # Some lowercase forms are more than one character, e.g. 'İ',
+                # and these can't come from a single key anyhow
+                if len(char) == 1 and ord(char) < len(self._key_letters):
+                    self._key_letters[ord(char)] = letter
+
+        # What an empty row of the board looks like
+        self._blank_row = '|' + '|'.join(self._EMPTY * self._length) + '|'
+
         # Set up the colour pairs; zero is reserved. Hopefully these are okay
         # for red/green colour blind people.
         curses.init_pair(self._EMPTY_PAIR,   curses.COLOR_BLACK, curses.COLOR_WHITE)
@@ -203,6 +269,22 @@ class WordGuess():
             curses.init_pair(self._PARTIAL_PAIR, curses.COLOR_WHITE, curses.COLOR_BLUE )
             curses.init_pair(self._EXACT_PAIR,   curses.COLOR_WHITE, curses.COLOR_GREEN)
 
+        # The display attributes for each of the colour pairs, so that we don't
+        # have to ask curses for them every time that we draw something
+        self._attrs = {
+            pair : curses.color_pair(pair)
+            for pair in (self._EMPTY_PAIR,
+                         self._BOARD_PAIR,
+                         self._GUESS_PAIR,
+                         self._MISS_PAIR,
+                         self._PARTIAL_PAIR,
+                         self._EXACT_PAIR,
+                         self._MESSAGE_PAIR)
+        }
+
+        # Draw the parts of the screen which don't change
+        self._draw_chrome()
+
 
     def play(self) -> None:
         """
@@ -211,17 +293,9 @@ class WordGuess():
         won  = 0
         lost = 0
         while True:
-            # Draw the board
-            self._draw_board()
-
-            # Show the current score
-            score = f'Won {won}  Lost {lost}'
-            self._scr.addstr(
-                self._BOARD_TOP + self._tries + 2,
-                (self._max_x - len(score) - 1) // 2,
-                score,
-                curses.color_pair(self._MESSAGE_PAIR)
-            )
+            # Clear the board and show the current score
+            self._reset_cells()
+            self._set_score(f'Won {won}  Lost {lost}')
 
             # And play
             try:
@@ -246,6 +320,9 @@ class WordGuess():
             while True:
                 if ch  == self._ESCAPE:
                     return
+                elif ch == curses.KEY_RESIZE:
+                    self._redraw()
+                    ch = self._scr.getch()
                 elif (self._SPACE <= ch <= self._DEL) or \
                      ch in (self._NEWLINE, self._RETURN):
                     break
@@ -260,11 +337,6 @@ class WordGuess():
 
         :param word: The word to guess.
         """
-        # Draw the screen
-        for y in range(0, self._tries):
-            for x in range(0, self._length):
-                self._set_board_char(x, y, self._EMPTY, self._EMPTY_PAIR)
-
         # Say we're ready to go
         self._message("Guess the word!")
 
@@ -279,10 +351,19 @@ class WordGuess():
 
         # Keep going until the user has guessed
         while position[1] < self._tries:
+            # Make sure that what we have drawn is on the screen before we wait
+            # for the player
+            self._refresh()
+
             key = -1
             while key == -1:
                 key = self._scr.getch()
 
+            # If the window changed size then we need to draw it all again
+            if key == curses.KEY_RESIZE:
+                self._redraw()
+                continue
+
             # Blank out the message now that we're doing something
             self._message('')
 
@@ -304,17 +385,12 @@ class WordGuess():
             elif position[0] < self._length:
                 # We're in the guessing phase here
 
-                # Whether we move on after displaying the char
-                move = False
-
                 # Okay, this is likely someone entering a character which is
-                # part of their guess for the word
-                try:
-                    # Turn it into a character and see if we want to use it
-                    char = chr(key).upper()
-                    if (len(char) == 1 and
-                        char.isalpha() and
-                        char in self._letters):
+                # part of their guess for the word. See if it's one which we
+                # want to use.
+                if 0 <= key < len(self._key_letters):
+                    char = self._key_letters[key]
+                    if char is not None:
                         # Put in the letter
                         guess[position[0]] = char
                         self._set_board_char(position[0],
@@ -325,10 +401,6 @@ class WordGuess():
                         # And move on
                         position[0] += 1
 
-                except ValueError:
-                    # Ignore
-                    pass
-
             elif key == curses.KEY_ENTER or key == ord('\n'):
                 # All the guess letters are filled in and the user is guessing
 
@@ -339,25 +411,19 @@ class WordGuess():
                     curses.beep()
                     continue
 
-                # It's a word we know, see if it's a match
-                letters = list(word)
-                pairs   = [self._MISS_PAIR] * self._length
+                # It's a word we know, see if it's a match. We keep a count of
+                # the letters in the word which were not exactly matched.
+                counts = dict()
+                pairs  = [self._MISS_PAIR] * self._length
 
                 # First look for exact matches
                 for i in range(self._length):
-                    # Colour the guess accordingly
                     if guess[i] == word[i]:
                         # Exact match
                         pairs[i] = self._EXACT_PAIR
-
-                        # Blank it out so that it's removed from further match
-                        # attempts. This disambiguates a second occurance saying
-                        # it matched "somewhere".
-                        letters[i] = None
-
                     else:
-                        # Not an exact match
-                        match = False
+                        # Not an exact match so the letter is still up for grabs
+                        counts[word[i]] = counts.get(word[i], 0) + 1
 
                 # Now look for partial matches
                 for i in range(self._length):
@@ -365,20 +431,12 @@ class WordGuess():
                     if pairs[i] == self._EXACT_PAIR:
                         continue
 
-                    # Else look for it
-                    try:
-                        # Look for it
-                        index = letters.index(guess[i])
-
-                        # If we found it _somewhere_ then this was a partial match
+                    # If it's _somewhere_ else then this was a partial match. We
+                    # use up the count so that a second occurance doesn't also
+                    # say it matched "somewhere".
+                    if counts.get(guess[i], 0) > 0:
                         pairs[i] = self._PARTIAL_PAIR
-
-                        # And blank, for the same reasons as above
-                        letters[index] = None
-
-                    except ValueError:
-                        # Nothing to do
-                        pass
+                        counts[guess[i]] -= 1
 
                 # Now paint the board and the info section
                 for i in range(self._length):
@@ -397,8 +455,9 @@ class WordGuess():
                         info_letters[guess[i]] = pairs[i]
                     self._set_info_letter(guess[i], info_letters[guess[i]])
 
-                    # And wait a bit
-                    time.sleep(0.1)
+                    # Show them and wait a bit
+                    self._refresh()
+                    curses.napms(100)
 
                 # Done?
                 if all((p == self._EXACT_PAIR) for p in pairs):
@@ -426,43 +485,104 @@ class WordGuess():
         print()
 
 
-    def _draw_board(self):
+    def _draw_chrome(self):
         """
-        Draw the board, ready for play
+        Draw the parts of the screen which stay the same from round to round,
+        i.e. the title and the board outline.
         """
-        # Start blank
-        self._scr.clear()
+        # Start blank. We erase() rather than clear() since the latter makes
+        # curses repaint the whole terminal, rather than just what changed.
+        self._scr.erase()
 
         # Draw the title
         x = (self._max_x - len(self._TITLE) - 1) // 2
         self._scr.addstr(
-            1, x, self._TITLE, curses.color_pair(self._MESSAGE_PAIR)
+            1, x, self._TITLE, self._attrs[self._MESSAGE_PAIR]
         )
         self._scr.addstr(
-            2, x, '=' * len(self._TITLE), curses.color_pair(self._MESSAGE_PAIR)
+            2, x, '=' * len(self._TITLE), self._attrs[self._MESSAGE_PAIR]
         )
 
-        # The board outline
-        dx = self._max_x // 2 - self._length - 1
-        dy = self._BOARD_TOP
-        self._scr.addstr(
-            self._BOARD_TOP - 1, dx, '/' + '-' * (self._length * 2 - 1) + '\\',
-            curses.color_pair(self._BOARD_PAIR)
+        # The top and bottom of the board outline; the rows are drawn along
+        # with the cells. We use insstr() for the bottom since addstr() fails
+        # when it writes into the bottom right corner of a window.
+        self._board_win.addstr(
+            0, 0, '/' + '-' * (self._length * 2 - 1) + '\\',
+            self._attrs[self._BOARD_PAIR]
         )
-        for i in range(self._tries):
-            for j in range(self._length + 1):
-                self._scr.addstr(
-                    self._BOARD_TOP + i, dx + 2 * j, '|' ,
-                    curses.color_pair(self._BOARD_PAIR)
-                )
-        self._scr.addstr(
-            self._BOARD_TOP + self._tries, dx, '\\' + '-' * (self._length * 2 - 1) + '/',
-            curses.color_pair(self._BOARD_PAIR)
+        self._board_win.insstr(
+            self._tries + 1, 0, '\\' + '-' * (self._length * 2 - 1) + '/',
+            self._attrs[self._BOARD_PAIR]
         )
+        self._dirty = True
+
+
+    def _reset_cells(self):
+        """
+        Clear out the board cells and the info letters, ready for a new round.
+        """
+        self._board_cells.clear()
+        self._info_pairs.clear()
+        self._draw_cells()
+
+        # And display it
+        self._refresh()
+
+
+    def _draw_cells(self):
+        """
+        Draw the board cells and the info letters, as we last set them.
+        """
+        # The board rows, with all the cells empty. We draw each row in one go,
+        # using the pair which backspace uses for an empty cell; the edges
+        # come out the same since it has the same colours as the board's.
+        for i in range(self._tries):
+            self._board_win.addstr(
+                i + 1, 0, self._blank_row, self._attrs[self._EMPTY_PAIR]
+            )
+        self._dirty = True
+
+        # Now fill in any which have been set
+        for ((x, y), (character, pair)) in tuple(self._board_cells.items()):
+            self._set_board_char(x, y, character, pair)
 
         # The info chars
         for letter in self._sorted_letters:
-            self._set_info_letter(letter, self._EMPTY_PAIR)
+            self._set_info_letter(letter,
+                                  self._info_pairs.get(letter, self._EMPTY_PAIR))
+
+
+    def _redraw(self):
+        """
+        Draw everything again, for when the window has changed size.
+        """
+        # Figure out the new layout
+        (self._max_y, self._max_x) = self._scr.getmaxyx()
+        self._layout()
+
+        # And draw it all
+        self._draw_chrome()
+        self._draw_cells()
+        self._set_score(self._score)
+        self._message(self._msg)
+
+
+    def _set_score(self, score):
+        """
+        Show the given score, below the board.
+        """
+        self._score = score
+
+        # Size the window to fit the score, and no more, so that it doesn't
+        # cover anything around it. It has a blank column at the end since
+        # curses won't let us write into the bottom right corner. The score
+        # only ever gets longer so the new one always covers the old one.
+        self._score_win.resize(1, len(score) + 1)
+        self._score_win.mvwin(self._BOARD_TOP + self._tries + 2,
+                              (self._max_x - len(score) - 1) // 2)
+        self._score_win.erase()
+        self._score_win.addstr(0, 0, score, self._attrs[self._MESSAGE_PAIR])
+        self._dirty = True
 
 
     def _set_board_char(self,
@@ -478,74 +598,166 @@ class WordGuess():
         :param character: The single character to set.
         :param pair:      The colour pair to use.
         """
-        # Determine the x and y for the display
-        dx = self._max_x // 2 - self._length + 2 * x
-        dy = self._BOARD_TOP + y
+        # Determine the x and y within the board window, which includes the
+        # outline
+        dx = 2 * x + 1
+        dy = y + 1
 
         if len(character) == 1:
+            # Remember it, in case we need to redraw
+            self._board_cells[(x, y)] = (character, pair)
+
             # The X and Y are reversed for curses, we do that here.
-            self._scr.addstr(dy,
-                             dx,
-                             character,
-                             curses.color_pair(pair))
-        self._scr.refresh()
+            self._board_win.addch(dy,
+                                  dx,
+                                  character,
+                                  self._attrs[pair])
+            self._dirty = True
 
 
     def _message(self, msg):
         """
         Put a message on the screen.
         """
-        # Cut up the message if it wraps and see how to centre it
-        width = 0
+        # Remember it, in case we need to redraw
+        self._msg = msg
+
+        # Cut up the message if it wraps
         lines = []
         while len(msg) > 0:
-            part = msg[:self._max_x]
-            lines.append(part)
+            lines.append(msg[:self._max_x])
             msg = msg[self._max_x:]
-            width = max(width, len(part))
 
-        # Pad out the lines to a block
-        offset = self._BOARD_TOP + self._tries + self._MESSAGE_OFFSET
-        height = min(self._max_y - offset, 4)
+        # Pad out the lines to fill the message window, and no more
+        (height, _) = self._msg_win.getmaxyx()
         while len(lines) < height:
             lines.append('')
+        lines = lines[:height]
 
         # Render it
         for (i, line) in enumerate(lines):
-            # We need to pad since otherwise we can leave parts of an old
+            # Centre it, padding since otherwise we can leave parts of an old
             # message behind
-            pad       = self._max_x - width
-            left_pad  = pad // 2
-            right_pad = max(0, pad - left_pad - 1)
-
-            # The line we want to render is now this
-            line = ' ' * left_pad + line + ' ' * right_pad
+            line = f'{line:^{self._max_x - 1}}'
 
             # And place it
-            self._scr.addstr(
-                offset + i,
-                0,
-                line, curses.color_pair(self._MESSAGE_PAIR)
-            )
+            self._msg_win.addstr(i, 0, line, self._attrs[self._MESSAGE_PAIR])
+        self._dirty = True
 
         # And display it
-        self._scr.refresh()
+        self._refresh()
+
+
+    def _refresh(self):
+        """
+        Refresh the screen, if we have drawn anything since we last did so. We
+        only do this once per logical update, rather than for every character,
+        since it can be slow over, say, an SSH connection.
+        """
+        if self._dirty:
+            # Copy the changes in each window into curses' virtual screen and
+            # then send the differences to the terminal in one go. Windows which
+            # have not changed cost next to nothing here.
+            for window in self._windows:
+                window.noutrefresh()
+            curses.doupdate()
+            self._dirty = False
+
+
+    def _is_wanted(self, word, length):
+        """
+        Whether the given uppercase word is one which we want to play with.
+
+        We avoid offensive words and ones which look like they are plurals, past
+        tense, etc. Some of this will general false positives but that's not the
+        end of the world.
+        """
+        # These are ordered cheapest first so that most words are rejected
+        # before we get to the expensive checks
+        return (len(word) == length             and
+                word.isalpha()                  and
+                word not in self._OFFENSIVE_SET and
+                not self._is_derived(word))
+
+
+    def _is_derived(self, word):
+        """
+        Whether the given uppercase word looks like it was derived from another
+        one which we know about, e.g. a plural or past tense.
+        """
+        # Quickly weed out the ones which can't be
+        if not word.endswith(self._SUFFIXES):
+            return False
+
+        # Look for the word which it might have come from
+        for (suffix, endings) in self._SUFFIX_STEMS.items():
+            if word.endswith(suffix):
+                stem = word[:-len(suffix)]
+                for ending in endings:
+                    if stem + ending in self._all_words:
+                        return True
+
+        # Nope
+        return False
 
 
     def _rot13upper(self, word):
         """
         Do a rot13 on the given word, as uppercase.
         """
-        return ''.join(
-            chr((ord(c) - ord('A') + 13) % 26 + ord('A'))
-            for c in word.upper()
-        )
+        return word.upper().translate(self._ROT13)
 
 
     def _set_info_letter(self, letter, colour_pair):
         """
         Draw the given letter, in the right spot, using the given colour pair.
         """
+        self._info_pairs[letter] = colour_pair
+        (window, cx, cy) = self._info_coords[letter]
+        window.addch(cy, cx, letter, self._attrs[colour_pair])
+        self._dirty = True
+
+
+    def _layout(self):
+        """
+        Figure out where on the screen everything goes, and create the windows
+        for them. This only depends on the screen size so we do it up front,
+        and again if the screen changes size.
+        """
+        # The board, including its outline, goes in the middle
+        dx = self._max_x // 2 - self._length - 1
+        self._board_win = curses.newwin(self._tries + 2,
+                                        2 * self._length + 1,
+                                        self._BOARD_TOP - 1,
+                                        dx)
+
+        # The info letters go either side of it
+        self._layout_info_letters()
+
+        # The score goes below it, in a window which is sized to fit when we
+        # set it, and the message below that, across the whole screen
+        self._score_win = curses.newwin(1,
+                                        1,
+                                        self._BOARD_TOP + self._tries + 2,
+                                        0)
+        offset = self._BOARD_TOP + self._tries + self._MESSAGE_OFFSET
+        height = min(self._max_y - offset, 4)
+        self._msg_win = curses.newwin(height, self._max_x, offset, 0)
+
+        # All the windows, in the order in which we refresh them. Where they
+        # overlap, which they can for some board sizes, the later ones win.
+        self._windows = (self._scr,
+                         self._board_win,
+                         *self._info_wins,
+                         self._score_win,
+                         self._msg_win)
+
+
+    def _layout_info_letters(self):
+        """
+        Figure out where each of the info letters goes, and create the windows
+        for them.
+        """
         # How many letters
         count = len(self._sorted_letters)
 
@@ -565,30 +777,37 @@ class WordGuess():
         off_left  = int(math.floor(self._max_x / 2)) - x_width
         off_right = int(math.ceil (self._max_x / 2)) + 3
 
-        # How long should each column be?
-        col_length = math.floor(count / num_cols)
-
-        # Figure out the index of our letter in the sorted set
-        index = self._sorted_letters.index(letter)
-
-        # The coordinates within the columns
-        x = index %  num_cols
-        y = index // num_cols
-
-        # We want gaps between the columns
-        x *= 2
-
-        # Now place it
-        if x < num_cols:
-            # Left side
-            cx = off_left  + x
-        else:
-            # Right side
-            cx = off_right + x
-        cy = self._BOARD_TOP + 2 * y
-
-        # And place it
-        self._scr.addstr(cy, cx, letter, curses.color_pair(colour_pair))
+        # A window for each side. These have a blank row at the bottom since
+        # curses won't let us write into the bottom right corner.
+        height = 2 * math.ceil(count / num_cols)
+        width  = num_cols - 1
+        left  = curses.newwin(height, width, self._BOARD_TOP, off_left)
+        right = curses.newwin(height, width, self._BOARD_TOP, off_right + num_cols)
+        self._info_wins = (left, right)
+
+        # Place each letter in turn
+        self._info_coords = dict()
+        for (index, letter) in enumerate(self._sorted_letters):
+            # The coordinates within the columns
+            x = index %  num_cols
+            y = index // num_cols
+
+            # We want gaps between the columns
+            x *= 2
+
+            # Now place it
+            if x < num_cols:
+                # Left side
+                window = left
+                cx = x
+            else:
+                # Right side
+                window = right
+                cx = x - num_cols
+            cy = 2 * y
+
+            # And remember it
+            self._info_coords[letter] = (window, cx, cy)
 
 
 # ============================================================================